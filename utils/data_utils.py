@@ -1,4 +1,7 @@
 import os
+import hashlib
+import tempfile
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -10,6 +13,22 @@ __all__ = ['load_data', 'get_project_root',          # This is a special variabl
            'clean_train_data','check_missing_hours'] # Here, it says only load_data and get_project_root will be available, 
                                                      # keeping the module clean and explicit.
 
+# Project root (one level above utils/), resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Known hurricane landfalls masked out of the training data (Sandy)
+_HURRICANE_DAYS = pd.to_datetime(['2012-10-29'])
+
+# Cyclical encoding of the 24 possible hours, computed once at import
+_HOUR_ANGLE = np.arange(24) * (2 * np.pi / 24)
+_HOUR_SIN = np.sin(_HOUR_ANGLE)
+_HOUR_COS = np.cos(_HOUR_ANGLE)
+
+# Rolling statistics shared across clean_train_data calls (e.g. Optuna trials), keyed by
+# training data contents, window_size and hurricane_window
+_ROLLING_STATS_CACHE = OrderedDict()
+_ROLLING_STATS_CACHE_SIZE = 32
+
 def get_project_root():
     """
     "Return absolute path to project root"
@@ -24,42 +43,127 @@ def get_project_root():
     .parent: This is a property of a Path object that gives you the directory containing the current path. 
              So, Path(__file__).parent moves up one level to the utils/ folder 
              (e.g., /home/user/energy_forecast/utils/).
+
+    The path is resolved once at import (_PROJECT_ROOT), so repeated calls are free.
     """
-    return Path(__file__).parent.parent
+    return _PROJECT_ROOT
+
+def _write_parquet_cache(df, parquet_path):
+    """
+    Best-effort write of df to parquet_path.
+
+    The frame is written to a temp file in the same directory and moved into place with
+    os.replace, so an interrupted write never leaves a truncated cache behind. Failures
+    (e.g. a read-only data directory) are ignored; the caller simply re-parses next time.
+
+    Args:
+        df (pd.DataFrame): Frame to cache.
+        parquet_path (Path): Final cache location.
+
+    Returns:
+        None
+    """
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=parquet_path.parent,
+                                        prefix=f'.{parquet_path.stem}.', suffix='.tmp.parquet')
+        os.close(fd)
+        df.to_parquet(tmp_path, engine='pyarrow', compression='snappy')
+        # mkstemp creates the file as 0600; give the cache the usual umask-based mode so
+        # other users of a shared checkout can read it
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, parquet_path)
+        tmp_path = None
+    except (OSError, ImportError):
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def load_data(relative_path, y_dtype=np.float32):
+    """
+    Load data relative to project root.
+
+    The parsed frame is cached as a Parquet file next to the CSV; later calls read the cache
+    instead of re-parsing the CSV, as long as the cache is newer than the CSV.
+
+    Args:
+        relative_path (str or Path): CSV path relative to the project root.
+        y_dtype (np.dtype): dtype of the 'y' column. Defaults to float32, which holds the
+                            whole-MW PJME readings exactly at half the memory of float64.
 
-def load_data(relative_path):
-    """Load data relative to project root"""
+    Returns:
+        pd.DataFrame: DataFrame with 'ds' (datetime) and 'y' columns.
+    """
     root = get_project_root()
     full_path = root / relative_path
     
     if not full_path.exists():
         raise FileNotFoundError(f"Data file not found at: {full_path}")
-    
-    return pd.read_csv(full_path, parse_dates=["Datetime"]).rename(
-        columns={'Datetime': 'ds', 'PJME_MW': 'y'})
+
+    parquet_path = full_path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= full_path.stat().st_mtime:
+        try:
+            return pd.read_parquet(parquet_path, engine='pyarrow').astype({'y': y_dtype})
+        except (OSError, ValueError, ImportError):
+            # Unreadable cache (e.g. truncated write): re-parse the CSV and rewrite it below
+            pass
+
+    df = pd.read_csv(full_path, usecols=['Datetime', 'PJME_MW'])
+    # Explicit format skips pandas' per-row format inference
+    df['Datetime'] = pd.to_datetime(df['Datetime'], format='%Y-%m-%d %H:%M:%S', cache=True)
+    df = df.rename(columns={'Datetime': 'ds', 'PJME_MW': 'y'})
+
+    # Cache at full precision so any y_dtype can be served from it
+    _write_parquet_cache(df, parquet_path)
+
+    return df.astype({'y': y_dtype})
 
 
 def create_features(df):
     """
     Create temporal features from the datetime column.
     """
-    # Temporal features
-    df['hour'] = df['ds'].dt.hour
-    df['day_of_week'] = df['ds'].dt.dayofweek
-    df['is_weekend'] = df['day_of_week'].isin([5, 6]).astype(int)
-
-    # Quarterly (annual) features 
-    quarters = {
-        1: 'Q1_Jan-Mar',
-        2: 'Q2_Apr-Jun', 
-        3: 'Q3_Jul-Sep',
-        4: 'Q4_Oct-Dec'
-    }
-    df['quarter'] = df['ds'].dt.quarter.map(quarters)
-    
-    # Cyclical hour encoding
-    df['hour_sin'] = np.sin(2 * np.pi * df['hour'] / 24)
-    df['hour_cos'] = np.cos(2 * np.pi * df['hour'] / 24)
+    ds = df['ds']
+    quarters = ['Q1_Jan-Mar', 'Q2_Apr-Jun', 'Q3_Jul-Sep', 'Q4_Oct-Dec']
+
+    if ds.dtype == 'datetime64[ns]' and not ds.hasnans:
+        # Calendar fields straight from the tz-naive datetime64[ns] buffer, instead of
+        # one .dt accessor pass per field
+        ds_values = ds.to_numpy()
+        hours_since_epoch = ds_values.view('i8') // 3_600_000_000_000
+        month_index = ds_values.astype('datetime64[M]').view('i8') % 12  # Jan=0
+
+        # Temporal features
+        df['hour'] = (hours_since_epoch % 24).astype(np.int8)
+        df['day_of_week'] = ((hours_since_epoch // 24 + 3) % 7).astype(np.int8)  # 1970-01-01 was a Thursday (Mon=0)
+
+        # Quarterly (annual) features, built from integer codes (quarter 1 -> code 0)
+        quarter_codes = (month_index // 3).astype(np.int8)
+
+        # Cyclical hour encoding, gathered from the precomputed 24-entry tables
+        hour = df['hour'].to_numpy()
+        hour_sin, hour_cos = _HOUR_SIN[hour], _HOUR_COS[hour]
+    else:
+        # tz-aware or missing timestamps: .dt gives local-time fields and NaN for NaT
+        df['hour'] = ds.dt.hour
+        df['day_of_week'] = ds.dt.dayofweek
+
+        # NaT -> code -1, i.e. a missing category rather than a made-up quarter
+        quarter_codes = ds.dt.quarter.fillna(0).to_numpy().astype(np.int8) - 1
+
+        hour_angle = df['hour'].to_numpy(dtype=np.float64) * (2 * np.pi / 24)
+        hour_sin, hour_cos = np.sin(hour_angle), np.cos(hour_angle)
+
+    df['is_weekend'] = (df['day_of_week'].to_numpy() >= 5).astype(np.int8)  # Sat=5, Sun=6
+    df['quarter'] = pd.Categorical.from_codes(quarter_codes, categories=quarters, ordered=True)
+    df['hour_sin'] = hour_sin
+    df['hour_cos'] = hour_cos
 
     return df
 
@@ -74,10 +178,132 @@ def split_train_test(df, cutoff_date):
     Returns:
         tuple: (training_set, test_set) as pd.DataFrames.
     """
-    full_train = df[df['ds'] < cutoff_date].copy()
-    test_set = df[df['ds'] >= cutoff_date].copy()
+    ds = df['ds']
+    if ds.dtype == 'datetime64[ns]' and ds.is_monotonic_increasing:
+        # Sorted tz-naive series: one binary search gives the split point, no boolean masks needed
+        split_idx = ds.searchsorted(pd.Timestamp(cutoff_date), side='left')
+        return df.iloc[:split_idx].copy(), df.iloc[split_idx:].copy()
+
+    full_train = df[ds < cutoff_date].copy()
+    test_set = df[ds >= cutoff_date].copy()
     return full_train, test_set
 
+def _fill_gaps(values):
+    """
+    Forward-fill NaNs, then back-fill any leading NaNs (same result as .ffill().bfill()).
+
+    Both fills come from one index array: a running maximum of valid positions picks the
+    last valid value for every gap, and leading gaps point at the first valid value.
+
+    Args:
+        values (np.ndarray): 1-D float array.
+
+    Returns:
+        np.ndarray: Filled copy of values (left all-NaN if there is no valid value).
+    """
+    valid = ~np.isnan(values)
+    if valid.all() or not valid.any():
+        return values.copy()
+
+    fill_idx = np.where(valid, np.arange(len(values)), 0)
+    np.maximum.accumulate(fill_idx, out=fill_idx)
+    first_valid = valid.argmax()
+    fill_idx[:first_valid] = first_valid
+    return values[fill_idx]
+
+def _rolling_median_iqr(values, window_size):
+    """
+    Centered rolling median and interquartile bounds of a 1-D array.
+
+    This is still three separate passes over values: median(), quantile(0.25) and
+    quantile(0.75) each rebuild their own indexable skiplist (O(log W) insert/remove per
+    step); only the window definition is shared.
+
+    Args:
+        values (np.ndarray): Gap-free series values.
+        window_size (int): Number of samples in each centered window.
+
+    Returns:
+        tuple: (median, q25, q75) as np.ndarrays, NaN where the window is incomplete.
+    """
+    # Rolling kernels work in float64; cast once here rather than once per aggregation
+    rolling = pd.Series(values, dtype=np.float64).rolling(window=window_size, center=True)
+    # Linear interpolation, same as np.percentile
+    return (rolling.median().to_numpy(),
+            rolling.quantile(0.25).to_numpy(),
+            rolling.quantile(0.75).to_numpy())
+
+def _hurricane_mask(ds, hurricane_window):
+    """
+    Boolean mask of the rows in ds that fall on a hurricane period timestamp.
+
+    Args:
+        ds (pd.Series): Datetime column.
+        hurricane_window (int): Days masked on each side of every entry in _HURRICANE_DAYS.
+
+    Returns:
+        np.ndarray: Boolean mask aligned with ds.
+    """
+    window = pd.Timedelta(days=hurricane_window)
+    hurricane_periods = np.concatenate([
+        pd.date_range(date - window, date + window).to_numpy()
+        for date in _HURRICANE_DAYS
+    ])
+    if ds.dtype != 'datetime64[ns]':
+        # tz-aware or object timestamps: same membership test as the original Series.isin
+        return ds.isin(pd.DatetimeIndex(hurricane_periods)).to_numpy()
+
+    ds_values = ds.to_numpy()
+    if not ds.is_monotonic_increasing:
+        return np.isin(ds_values, hurricane_periods)
+
+    # Binary search the period timestamps instead of hashing every row
+    lo = np.searchsorted(ds_values, hurricane_periods, side='left')
+    hi = np.searchsorted(ds_values, hurricane_periods, side='right')
+    mask = np.zeros(len(ds_values), dtype=bool)
+    for i, j in zip(lo, hi):
+        mask[i:j] = True
+    return mask
+
+def _rolling_stats(train_df, window_size, hurricane_window):
+    """
+    Hurricane mask, rolling median and rolling IQR used by clean_train_data.
+
+    None of these depend on iqr_multiplier, so results are cached (LRU, keyed by the 'ds'/'y'
+    contents plus both window settings) and trials that revisit a window setting only re-apply
+    the outlier threshold.
+
+    Args:
+        train_df (pd.DataFrame): Training DataFrame with 'ds' and 'y' columns.
+        window_size (int): Rolling window length in samples.
+        hurricane_window (int): Days masked around each hurricane.
+
+    Returns:
+        tuple: (hurricane_mask, rolling_median, iqr) as fresh np.ndarrays.
+    """
+    y_values = np.ascontiguousarray(train_df['y'].to_numpy())
+    # hash_pandas_object handles any ds dtype (naive, tz-aware, object); the dtype string
+    # keeps e.g. the same instants in different time zones apart
+    ds_hashes = pd.util.hash_pandas_object(train_df['ds'], index=False).to_numpy()
+    digest = hashlib.blake2b(ds_hashes.tobytes(), digest_size=16)
+    digest.update(str(train_df['ds'].dtype).encode())
+    digest.update(y_values.dtype.str.encode())
+    digest.update(y_values.tobytes())
+    key = (digest.hexdigest(), window_size, hurricane_window)
+
+    if key in _ROLLING_STATS_CACHE:
+        _ROLLING_STATS_CACHE.move_to_end(key)
+    else:
+        hurricane_mask = _hurricane_mask(train_df['ds'], hurricane_window)
+        temp_y = _fill_gaps(np.where(hurricane_mask, np.nan, y_values))
+        rolling_median, q25, q75 = _rolling_median_iqr(temp_y, window_size)
+        _ROLLING_STATS_CACHE[key] = (hurricane_mask, rolling_median, q75 - q25)
+        if len(_ROLLING_STATS_CACHE) > _ROLLING_STATS_CACHE_SIZE:
+            _ROLLING_STATS_CACHE.popitem(last=False)
+
+    # Copies keep callers from mutating cached arrays through their DataFrame columns
+    return tuple(stat.copy() for stat in _ROLLING_STATS_CACHE[key])
+
 def clean_train_data(trial_or_params, train_df):
     """
     Clean training data by masking hurricane periods and imputing outliers.
@@ -112,27 +338,21 @@ def clean_train_data(trial_or_params, train_df):
     # Define hurricane dates and corresponding windows
     hurricane_dates = pd.DataFrame({
         'holiday': 'hurricane',
-        'ds': pd.to_datetime(['2012-10-29']),
+        'ds': _HURRICANE_DAYS,
         'lower_window': -cleaning_params['hurricane_window'],
         'upper_window': cleaning_params['hurricane_window']
     })
     
+    # Hurricane mask and rolling median/IQR are independent of iqr_multiplier (cached)
+    hurricane_mask, rolling_median, iqr = _rolling_stats(
+        df_clean, cleaning_params['window_size'], cleaning_params['hurricane_window'])
+
     # Mask hurricane periods by replacing values with NaN
-    hurricane_periods = []
-    for date in hurricane_dates['ds']:
-        start = date - pd.Timedelta(days=cleaning_params['hurricane_window'])
-        end = date + pd.Timedelta(days=cleaning_params['hurricane_window'])
-        hurricane_periods.extend(pd.date_range(start, end))
-    
-    df_clean.loc[df_clean['ds'].isin(hurricane_periods), 'y'] = np.nan
+    df_clean.loc[hurricane_mask, 'y'] = np.nan
     
     # Outlier detection using a rolling median and IQR
-    temp_y = df_clean['y'].ffill().bfill()
-    window_size = cleaning_params['window_size']
-    df_clean['rolling_median'] = temp_y.rolling(window=window_size, center=True).median()
-    df_clean['iqr'] = temp_y.rolling(window=window_size, center=True).apply(
-        lambda x: np.percentile(x, 75) - np.percentile(x, 25), raw=True
-    )
+    df_clean['rolling_median'] = rolling_median
+    df_clean['iqr'] = iqr
     
     # Flag outliers when the value deviates significantly from the rolling median
     df_clean['is_outlier'] = (
@@ -141,8 +361,8 @@ def clean_train_data(trial_or_params, train_df):
     ).astype(int)
     
     # Impute detected outliers with the rolling median
-    df_clean['y_clean'] = np.where(df_clean['is_outlier'], df_clean['rolling_median'], df_clean['y'])
-    df_clean['y_clean'] = df_clean['y_clean'].ffill().bfill()
+    df_clean['y_clean'] = _fill_gaps(
+        np.where(df_clean['is_outlier'], df_clean['rolling_median'], df_clean['y']))
 
     # Drop 'y' and rename 'y_clean' to 'y'
     df_clean = df_clean.drop('y', axis=1).rename(columns={'y_clean': 'y'})
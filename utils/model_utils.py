@@ -1,8 +1,30 @@
 #model_utils.py
 
+import numpy as np
 from prophet import Prophet
 
 
+def _abs_residuals_and_mape(actual, predicted):
+    """
+    Absolute residuals and MAPE (%) of predicted against actual.
+
+    The residual buffer is made absolute in place and reused for the percentage errors,
+    so only one extra N-length array is allocated.
+
+    Args:
+        actual (np.ndarray): Observed values.
+        predicted (np.ndarray): Forecast values, same length as actual.
+
+    Returns:
+        tuple: (mape, residuals), MAPE as a percentage and the absolute residuals as a
+               freshly allocated np.ndarray (never a view of the inputs).
+    """
+    residuals = np.subtract(actual, predicted)
+    np.abs(residuals, out=residuals)
+    mape = np.mean(residuals / actual) * 100
+    return mape, residuals
+
+
 def get_MAPE(train_set, test_set, forecast_train, forecast_test, show=False):
     """
     Calculate MAPE for training and test sets.
@@ -14,24 +36,16 @@ def get_MAPE(train_set, test_set, forecast_train, forecast_test, show=False):
         forecast_test (pd.DataFrame): Forecasts for test data with 'yhat'.
 
     Returns:
-        tuple: (mape_train, mape_test) as percentages.
+        tuple: (mape_train, mape_test) as percentages, followed by the absolute
+               residuals of each set as np.ndarrays.
     """
-    actual_train = train_set['y'].values
-    actual_test = test_set['y'].values
-    predicted_train = forecast_train['yhat'].values
-    predicted_test = forecast_test['yhat'].values
-
-    mape_train = (abs(actual_train - predicted_train) / actual_train).mean() * 100
-    mape_test = (abs(actual_test - predicted_test) / actual_test).mean() * 100
-
-    residuals_train = abs(actual_train - predicted_train)
-    residuals_test = abs(actual_test - predicted_test)
+    mape_train, residuals_train = _abs_residuals_and_mape(
+        train_set['y'].to_numpy(), forecast_train['yhat'].to_numpy())
+    mape_test, residuals_test = _abs_residuals_and_mape(
+        test_set['y'].to_numpy(), forecast_test['yhat'].to_numpy())
 
     if show == True:    
         print(f"Train set MAPE: {mape_train:.2f}%")
         print(f"Test set MAPE: {mape_test:.2f}%")
 
     return mape_train, mape_test, residuals_train, residuals_test
-
-
-    